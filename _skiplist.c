@@ -0,0 +1,317 @@
+/*
+ * Skip List core in C, loaded through ctypes by cskip_list.py.
+ *
+ * Keys are C int64 values, values are arbitrary Python objects. The
+ * library is opened with ctypes.PyDLL, so every call runs with the GIL
+ * held and may use the Python C API; a pending Python exception after a
+ * call is raised by ctypes in the caller.
+ *
+ * Build it with:  python setup.py build_ext --inplace
+ *
+ * setup.py builds it as an extension module, so it also defines an empty
+ * PyInit__skiplist: setuptools asks the linker to export that symbol on
+ * every platform. The sl_* entry points are exported explicitly so they
+ * are visible in a Windows DLL as well.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+#if defined(_WIN32) || defined(__CYGWIN__)
+#define SL_EXPORT __declspec(dllexport)
+#else
+#define SL_EXPORT __attribute__((visibility("default")))
+#endif
+
+typedef struct sl_node {
+    int64_t key;
+    PyObject *value;            /* owned reference */
+    int level;
+    struct sl_node *forward[];  /* level + 1 pointers */
+} sl_node;
+
+typedef struct {
+    int max_level;
+    int level;
+    double p;
+    Py_ssize_t size;
+    uint64_t rng;               /* xorshift64* state, never zero */
+    sl_node *header;
+    sl_node **update;           /* max_level + 1 scratch slots */
+} skiplist;
+
+static sl_node *
+node_new(int64_t key, PyObject *value, int level)
+{
+    sl_node *node = calloc(1, sizeof(sl_node) + (level + 1) * sizeof(sl_node *));
+    if (node == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    node->key = key;
+    Py_XINCREF(value);
+    node->value = value;
+    node->level = level;
+    return node;
+}
+
+static void
+node_free(sl_node *node)
+{
+    Py_XDECREF(node->value);
+    free(node);
+}
+
+static double
+rand_double(skiplist *sl)
+{
+    uint64_t x = sl->rng;
+    x ^= x >> 12;
+    x ^= x << 25;
+    x ^= x >> 27;
+    sl->rng = x;
+    return ((x * 0x2545F4914F6CDD1DULL) >> 11) * (1.0 / 9007199254740992.0);
+}
+
+static int
+random_level(skiplist *sl)
+{
+    int level = 0;
+    while (rand_double(sl) < sl->p && level < sl->max_level)
+        level++;
+    return level;
+}
+
+/* Last node whose key is < key; fills sl->update when record is set. */
+static sl_node *
+find_predecessor(skiplist *sl, int64_t key, int record)
+{
+    sl_node *current = sl->header;
+    sl_node *next;
+    int i;
+
+    for (i = sl->level; i >= 0; i--) {
+        while ((next = current->forward[i]) != NULL && next->key < key)
+            current = next;
+        if (record)
+            sl->update[i] = current;
+    }
+    return current;
+}
+
+static int
+as_key(PyObject *obj, int64_t *key)
+{
+    long long v = PyLong_AsLongLong(obj);
+    if (v == -1 && PyErr_Occurred())
+        return -1;
+    *key = (int64_t)v;
+    return 0;
+}
+
+SL_EXPORT skiplist *
+sl_new(int max_level, double p, uint64_t seed)
+{
+    skiplist *sl;
+
+    if (max_level < 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "max_level must be non-negative, got %d", max_level);
+        return NULL;
+    }
+    sl = calloc(1, sizeof(skiplist));
+    if (sl == NULL)
+        goto nomem;
+    sl->update = calloc(max_level + 1, sizeof(sl_node *));
+    sl->header = node_new(0, NULL, max_level);
+    if (sl->update == NULL || sl->header == NULL)
+        goto nomem;
+    sl->max_level = max_level;
+    sl->p = p;
+    sl->rng = seed ? seed : 0x9E3779B97F4A7C15ULL;
+    return sl;
+
+nomem:
+    if (sl != NULL) {
+        free(sl->update);
+        free(sl->header);
+        free(sl);
+    }
+    PyErr_NoMemory();
+    return NULL;
+}
+
+SL_EXPORT void
+sl_free(skiplist *sl)
+{
+    sl_node *node, *next;
+
+    if (sl == NULL)
+        return;
+    for (node = sl->header->forward[0]; node != NULL; node = next) {
+        next = node->forward[0];
+        node_free(node);
+    }
+    node_free(sl->header);
+    free(sl->update);
+    free(sl);
+}
+
+SL_EXPORT Py_ssize_t
+sl_len(skiplist *sl)
+{
+    return sl->size;
+}
+
+SL_EXPORT int
+sl_level(skiplist *sl)
+{
+    return sl->level;
+}
+
+/* Returns 1 if a new node was added, 0 if an existing value was replaced. */
+SL_EXPORT int
+sl_insert(skiplist *sl, PyObject *key_obj, PyObject *value)
+{
+    int64_t key;
+    sl_node *current, *node;
+    int i, new_level;
+
+    if (as_key(key_obj, &key) < 0)
+        return -1;
+
+    current = find_predecessor(sl, key, 1)->forward[0];
+    if (current != NULL && current->key == key) {
+        PyObject *old = current->value;
+        Py_INCREF(value);
+        current->value = value;
+        Py_DECREF(old);
+        return 0;
+    }
+
+    new_level = random_level(sl);
+    if (new_level > sl->level) {
+        for (i = sl->level + 1; i <= new_level; i++)
+            sl->update[i] = sl->header;
+        sl->level = new_level;
+    }
+
+    node = node_new(key, value, new_level);
+    if (node == NULL)
+        return -1;
+    for (i = 0; i <= new_level; i++) {
+        node->forward[i] = sl->update[i]->forward[i];
+        sl->update[i]->forward[i] = node;
+    }
+    sl->size++;
+    return 1;
+}
+
+/*
+ * New reference to the value, or to None when the key is absent
+ * (a py_object restype takes over the returned reference).
+ */
+SL_EXPORT PyObject *
+sl_search(skiplist *sl, PyObject *key_obj)
+{
+    int64_t key;
+    sl_node *current;
+    PyObject *value = Py_None;
+
+    if (as_key(key_obj, &key) < 0)
+        return NULL;
+
+    current = find_predecessor(sl, key, 0)->forward[0];
+    if (current != NULL && current->key == key)
+        value = current->value;
+    Py_INCREF(value);
+    return value;
+}
+
+SL_EXPORT int
+sl_delete(skiplist *sl, PyObject *key_obj)
+{
+    int64_t key;
+    sl_node *current;
+    int i;
+
+    if (as_key(key_obj, &key) < 0)
+        return -1;
+
+    current = find_predecessor(sl, key, 1)->forward[0];
+    if (current == NULL || current->key != key)
+        return 0;
+
+    for (i = 0; i <= sl->level; i++) {
+        if (sl->update[i]->forward[i] != current)
+            break;
+        sl->update[i]->forward[i] = current->forward[i];
+    }
+    while (sl->level > 0 && sl->header->forward[sl->level] == NULL)
+        sl->level--;
+    sl->size--;
+    node_free(current);
+    return 1;
+}
+
+/* Append (key, value) tuples with lo <= key <= hi to the list out. */
+SL_EXPORT int
+sl_items(skiplist *sl, PyObject *lo_obj, PyObject *hi_obj, PyObject *out)
+{
+    int64_t lo, hi;
+    sl_node *node;
+    PyObject *item;
+    int rc;
+
+    if (as_key(lo_obj, &lo) < 0 || as_key(hi_obj, &hi) < 0)
+        return -1;
+
+    for (node = find_predecessor(sl, lo, 0)->forward[0];
+         node != NULL && node->key <= hi;
+         node = node->forward[0]) {
+        item = Py_BuildValue("(LO)", (long long)node->key, node->value);
+        if (item == NULL)
+            return -1;
+        rc = PyList_Append(out, item);
+        Py_DECREF(item);
+        if (rc < 0)
+            return -1;
+    }
+    return 0;
+}
+
+/* Append (key, value) tuples of the nodes linked on level to the list out. */
+SL_EXPORT int
+sl_level_items(skiplist *sl, int level, PyObject *out)
+{
+    sl_node *node;
+    PyObject *item;
+    int rc;
+
+    if (level < 0 || level > sl->level)
+        return 0;
+    for (node = sl->header->forward[level]; node != NULL; node = node->forward[level]) {
+        item = Py_BuildValue("(LO)", (long long)node->key, node->value);
+        if (item == NULL)
+            return -1;
+        rc = PyList_Append(out, item);
+        Py_DECREF(item);
+        if (rc < 0)
+            return -1;
+    }
+    return 0;
+}
+
+/* Nothing to import from Python; the library is used through ctypes. */
+static struct PyModuleDef sl_module = {
+    PyModuleDef_HEAD_INIT, "_skiplist",
+    "C skip list core; use it through cskip_list.CSkipList.", -1, NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__skiplist(void)
+{
+    return PyModule_Create(&sl_module);
+}
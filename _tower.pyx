@@ -0,0 +1,77 @@
+"""
+Compiled tower layout for visualization.py.
+
+Lays out the rows of the compact (tower) visualization for integer keys in
+one C buffer. setup.py builds it when Cython is installed; without it,
+visualization.py uses its pure Python layout, which produces the same text.
+"""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.stdio cimport snprintf
+from libc.stdlib cimport free, malloc
+from libc.string cimport memcpy, memset
+
+cdef enum:
+    # Room for one cell: "[" + a signed 64-bit integer + "] " and the NUL
+    CELL_MAX = 24
+    # Room for a row prefix: "L" + a C int + ": " and the NUL
+    PREFIX_MAX = 16
+    # A level the node does not reach is drawn as spaces, including the
+    # space after the cell
+    BLANK_LEN = 6
+
+
+def build_tower(const long long[:] keys, const int[:] max_lvls, int max_level):
+    """
+    Lay out the tower rows from max_level down to level 0.
+
+    Args:
+        keys: Key of each node, in list order
+        max_lvls: Max level of each node
+        max_level: Highest level to draw
+
+    Returns:
+        The rows as ASCII bytes, every cell followed by a space and every
+        row by a newline
+    """
+    cdef Py_ssize_t n = keys.shape[0]
+    cdef Py_ssize_t i, row_len = PREFIX_MAX + 1
+    cdef int level
+    cdef char *cells = NULL
+    cdef int *widths = NULL
+    cdef char *buf = NULL
+    cdef char *p
+
+    if max_lvls.shape[0] != n:
+        raise ValueError("keys and max_lvls differ in length")
+
+    try:
+        # Format every key once; a cell is never narrower than the blank
+        cells = <char *>malloc(n * CELL_MAX + 1)
+        widths = <int *>malloc(n * sizeof(int) + 1)
+        if cells == NULL or widths == NULL:
+            raise MemoryError()
+        for i in range(n):
+            widths[i] = snprintf(cells + i * CELL_MAX, CELL_MAX, "[%3lld] ", keys[i])
+            row_len += widths[i]
+
+        buf = <char *>malloc((max_level + 1) * row_len + 1)
+        if buf == NULL:
+            raise MemoryError()
+        p = buf
+        for level in range(max_level, -1, -1):
+            p += snprintf(p, PREFIX_MAX, "L%d: ", level)
+            for i in range(n):
+                if max_lvls[i] >= level:
+                    memcpy(p, cells + i * CELL_MAX, widths[i])
+                    p += widths[i]
+                else:
+                    memset(p, b' ', BLANK_LEN)
+                    p += BLANK_LEN
+            p[0] = b'\n'
+            p += 1
+        return PyBytes_FromStringAndSize(buf, p - buf)
+    finally:
+        free(cells)
+        free(widths)
+        free(buf)
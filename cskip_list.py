@@ -0,0 +1,207 @@
+"""
+C-accelerated Skip List for integer keys, loaded with ctypes.
+
+The skip list core lives in _skiplist.c and is compiled into a shared
+library by setup.py (no Cython required). If the library has not been built
+or cannot be loaded, CSkipList is simply SkipListInt64, so code can always
+use:
+
+    from cskip_list import CSkipList
+
+Only the following is common to both, so code meant to run either way
+should stick to it:
+
+- CSkipList(max_level, p) and CSkipList.from_sorted(items, max_level, p)
+- search, insert, insert_many, delete, items_in_range, get_all_items,
+  display, the level attribute, iteration, len() and ``in``
+
+Keys must be integers in the signed 64-bit range; others raise TypeError or
+OverflowError. The nodes themselves (header, nodes(), random_level and the
+other SkipList internals) only exist on the pure Python version.
+"""
+
+import ctypes
+import logging
+import math
+import os
+import random
+import weakref
+from importlib.machinery import EXTENSION_SUFFIXES
+from operator import itemgetter
+from typing import Any, Optional
+
+from skip_list import (INT64_MAX, INT64_MIN, SkipListInt64, _check_max_level,
+                       _check_probability, _format_levels)
+
+
+log = logging.getLogger(__name__)
+
+
+def _load_library() -> Optional[ctypes.PyDLL]:
+    """
+    Load the compiled _skiplist library next to this file, if present.
+    
+    Returns:
+        The loaded library, or None if it has not been built or does not
+        load (for example, built for another platform)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    for suffix in EXTENSION_SUFFIXES:
+        path = os.path.join(here, "_skiplist" + suffix)
+        if os.path.exists(path):
+            break
+    else:
+        return None
+    
+    # PyDLL keeps the GIL held and raises any Python error set by the call
+    try:
+        lib = ctypes.PyDLL(path)
+    except OSError:
+        return None
+    handle, obj = ctypes.c_void_p, ctypes.py_object
+    signatures = {
+        "sl_new": ([ctypes.c_int, ctypes.c_double, ctypes.c_uint64], handle),
+        "sl_free": ([handle], None),
+        "sl_len": ([handle], ctypes.c_ssize_t),
+        "sl_level": ([handle], ctypes.c_int),
+        "sl_insert": ([handle, obj, obj], ctypes.c_int),
+        "sl_search": ([handle, obj], obj),
+        "sl_delete": ([handle, obj], ctypes.c_int),
+        "sl_items": ([handle, obj, obj, obj], ctypes.c_int),
+        "sl_level_items": ([handle, ctypes.c_int, obj], ctypes.c_int),
+    }
+    for name, (argtypes, restype) in signatures.items():
+        func = getattr(lib, name, None)
+        if func is None:
+            # Not exported, e.g. a stale build of an older _skiplist.c
+            return None
+        func.argtypes = argtypes
+        func.restype = restype
+    return lib
+
+
+_lib = _load_library()
+
+
+class _CSkipList:
+    """
+    Skip List of int64 keys backed by the C implementation in _skiplist.c.
+    """
+    
+    def __init__(self, max_level: int = 16, p: float = 1 / math.e):
+        """
+        Initialize skip list.
+        
+        Args:
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion, between 0 and 1 exclusive
+        """
+        _check_max_level(max_level)
+        _check_probability(p)
+        self.max_level = max_level
+        self.p = p
+        # Seed the C generator from random so random.seed() still applies
+        self._sl = _lib.sl_new(max_level, p, random.getrandbits(64))
+        weakref.finalize(self, _lib.sl_free, self._sl)
+    
+    @classmethod
+    def from_sorted(cls, items, max_level: int = 16, p: float = 1 / math.e) -> "_CSkipList":
+        """
+        Build a skip list from (key, value) pairs, as SkipList.from_sorted.
+        
+        Args:
+            items: Iterable of (key, value) pairs; a repeated key keeps the
+                last value
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion, between 0 and 1 exclusive
+        
+        Returns:
+            A new skip list holding the pairs
+        """
+        sl = cls(max_level, p)
+        # Each insert lands at the end of the list, so the C descent is short
+        sl.insert_many(sorted(items, key=itemgetter(0)))
+        return sl
+    
+    @property
+    def level(self) -> int:
+        """Current maximum level in the skip list."""
+        return _lib.sl_level(self._sl)
+    
+    def search(self, key: int) -> Optional[Any]:
+        """
+        Search for a key in the skip list.
+        
+        Returns:
+            Value associated with the key if found, None otherwise
+        """
+        return _lib.sl_search(self._sl, key)
+    
+    def insert(self, key: int, value: Any) -> None:
+        """
+        Insert a key-value pair into the skip list.
+        """
+        _lib.sl_insert(self._sl, key, value)
+    
+    def insert_many(self, items) -> None:
+        """
+        Insert (key, value) pairs from an iterable, in any order.
+        """
+        sl, insert = self._sl, _lib.sl_insert
+        for key, value in items:
+            insert(sl, key, value)
+    
+    def delete(self, key: int) -> bool:
+        """
+        Delete a key from the skip list.
+        
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        return _lib.sl_delete(self._sl, key) == 1
+    
+    def display(self) -> None:
+        """
+        Display the skip list structure level by level, in the same format
+        as SkipList.display (logged at INFO level).
+        """
+        if not log.isEnabledFor(logging.INFO):
+            return
+        
+        levels = []
+        for i in range(self.level, -1, -1):
+            items = []
+            _lib.sl_level_items(self._sl, i, items)
+            levels.append((i, [f"{key}:{value}" for key, value in items]))
+        
+        log.info(_format_levels("Skip List Structure:", levels))
+    
+    def items_in_range(self, lo: int, hi: int) -> list:
+        """
+        Get all key-value pairs with lo <= key <= hi in sorted order.
+        """
+        items = []
+        _lib.sl_items(self._sl, lo, hi, items)
+        return items
+    
+    def get_all_items(self) -> list:
+        """
+        Get all key-value pairs in sorted order.
+        """
+        return self.items_in_range(INT64_MIN, INT64_MAX)
+    
+    def __iter__(self):
+        return iter(self.get_all_items())
+    
+    def __len__(self) -> int:
+        return _lib.sl_len(self._sl)
+    
+    def __contains__(self, key: int) -> bool:
+        return self.search(key) is not None
+    
+    def __repr__(self):
+        return f"CSkipList({self.get_all_items()})"
+
+
+# Fall back to the pure Python implementation if the library is missing
+CSkipList = _CSkipList if _lib is not None else SkipListInt64
@@ -6,40 +6,47 @@ This file demonstrates various use cases and practical examples
 of the skip list data structure.
 """
 
+import skip_list
 from skip_list import SkipList
+import bisect
+import logging
 import random
+import sys
+
+
+log = logging.getLogger(__name__)
 
 
 def example_1_basic_operations():
     """Example 1: Basic insert, search, and delete operations"""
-    print("\n" + "="*70)
-    print("EXAMPLE 1: Basic Operations")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 1: Basic Operations")
+    log.info("="*70 + "\n")
     
     sl = SkipList()
     
     # Insert some numbers
-    print("Inserting numbers: 5, 2, 8, 1, 9, 3")
+    log.info("Inserting numbers: 5, 2, 8, 1, 9, 3")
     for num in [5, 2, 8, 1, 9, 3]:
         sl.insert(num, f"value_{num}")
     
     sl.display()
     
     # Search for values
-    print("Searching for key 8:", sl.search(8))
-    print("Searching for key 10:", sl.search(10))
+    log.info("Searching for key 8: %s", sl.search(8))
+    log.info("Searching for key 10: %s", sl.search(10))
     
     # Delete a value
-    print("\nDeleting key 5...")
+    log.info("\nDeleting key 5...")
     sl.delete(5)
     sl.display()
 
 
 def example_2_dictionary_implementation():
     """Example 2: Using skip list as a dictionary"""
-    print("\n" + "="*70)
-    print("EXAMPLE 2: Skip List as Dictionary")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 2: Skip List as Dictionary")
+    log.info("="*70 + "\n")
     
     # Create a phone book
     phonebook = SkipList()
@@ -52,51 +59,46 @@ def example_2_dictionary_implementation():
         ("Eve", "555-7890")
     ]
     
-    print("Building phonebook...")
+    log.info("Building phonebook...")
     for name, number in contacts:
         phonebook.insert(name, number)
-        print(f"  Added: {name} -> {number}")
+        log.info("  Added: %s -> %s", name, number)
     
-    print("\nPhonebook structure:")
+    log.info("\nPhonebook structure:")
     phonebook.display()
     
     # Look up some contacts
-    print("Looking up contacts:")
-    print(f"  Alice's number: {phonebook.search('Alice')}")
-    print(f"  Charlie's number: {phonebook.search('Charlie')}")
-    print(f"  Frank's number: {phonebook.search('Frank')}")
+    log.info("Looking up contacts:")
+    log.info("  Alice's number: %s", phonebook.search('Alice'))
+    log.info("  Charlie's number: %s", phonebook.search('Charlie'))
+    log.info("  Frank's number: %s", phonebook.search('Frank'))
 
 
 def example_3_range_queries():
     """Example 3: Getting values in a range"""
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Range Queries")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 3: Range Queries")
+    log.info("="*70 + "\n")
     
     sl = SkipList()
     
     # Insert random numbers
     numbers = random.sample(range(1, 100), 20)
-    print(f"Inserting numbers: {sorted(numbers)}")
+    log.info("Inserting numbers: %s", sorted(numbers))
     for num in numbers:
         sl.insert(num, f"value_{num}")
     
-    # Get all items in range
-    print("\nAll items in skip list (sorted):")
-    items = sl.get_all_items()
-    
     # Find items in range [30, 60]
-    range_items = [(k, v) for k, v in items if 30 <= k <= 60]
-    print(f"\nItems in range [30, 60]:")
-    for key, value in range_items:
-        print(f"  {key} -> {value}")
+    log.info("\nItems in range [30, 60]:")
+    for key, value in sl.items_in_range(30, 60):
+        log.info("  %s -> %s", key, value)
 
 
 def example_4_priority_queue():
     """Example 4: Using skip list for priority queue operations"""
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Priority Queue (Task Scheduler)")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 4: Priority Queue (Task Scheduler)")
+    log.info("="*70 + "\n")
     
     # Task scheduler where priority is the key
     scheduler = SkipList()
@@ -109,23 +111,23 @@ def example_4_priority_queue():
         (4, "Team Meeting")
     ]
     
-    print("Adding tasks with priorities (1 = highest):")
+    log.info("Adding tasks with priorities (1 = highest):")
     for priority, task in tasks:
         scheduler.insert(priority, task)
-        print(f"  Priority {priority}: {task}")
+        log.info("  Priority %s: %s", priority, task)
     
     scheduler.display()
     
-    print("Processing tasks in priority order:")
+    log.info("Processing tasks in priority order:")
     for priority, task in scheduler.get_all_items():
-        print(f"  [{priority}] {task}")
+        log.info("  [%s] %s", priority, task)
 
 
 def example_5_student_grades():
     """Example 5: Student grade management system"""
-    print("\n" + "="*70)
-    print("EXAMPLE 5: Student Grade Management")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 5: Student Grade Management")
+    log.info("="*70 + "\n")
     
     grades = SkipList()
     
@@ -140,33 +142,31 @@ def example_5_student_grades():
         (82, "Grace")
     ]
     
-    print("Recording student grades:")
+    log.info("Recording student grades:")
     # Use score as key, but handle duplicates by making composite keys
     for i, (score, name) in enumerate(students):
         # Use (score, i) as key to handle duplicates
         composite_key = f"{score:03d}_{i}"
         grades.insert(composite_key, (score, name))
-        print(f"  {name}: {score}")
+        log.info("  %s: %s", name, score)
     
-    print("\nStudents ranked by grade (highest to lowest):")
+    log.info("\nStudents ranked by grade (highest to lowest):")
     all_grades = grades.get_all_items()
     for key, (score, name) in reversed(all_grades):
-        print(f"  {score} - {name}")
+        log.info("  %s - %s", score, name)
     
     # Find students above 90
-    print("\nStudents with A grades (90+):")
+    log.info("\nStudents with A grades (90+):")
     for key, (score, name) in all_grades:
         if score >= 90:
-            print(f"  {name}: {score}")
+            log.info("  %s: %s", name, score)
 
 
 def example_6_time_series_data():
     """Example 6: Time series data storage"""
-    print("\n" + "="*70)
-    print("EXAMPLE 6: Time Series Data (Temperature Log)")
-    print("="*70 + "\n")
-    
-    temp_log = SkipList()
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 6: Time Series Data (Temperature Log)")
+    log.info("="*70 + "\n")
     
     # Simulate temperature readings (timestamp, temperature)
     import time
@@ -181,25 +181,26 @@ def example_6_time_series_data():
         (base_time + 300, 23.0),
     ]
     
-    print("Recording temperature readings:")
+    # Readings arrive in time order, so the log can be bulk loaded
+    log.info("Recording temperature readings:")
+    temp_log = SkipList.from_sorted(readings)
     for timestamp, temp in readings:
-        temp_log.insert(timestamp, temp)
-        print(f"  Time {timestamp}: {temp}°C")
+        log.info("  Time %s: %s°C", timestamp, temp)
     
-    print("\nTemperature timeline:")
+    log.info("\nTemperature timeline:")
     for timestamp, temp in temp_log.get_all_items():
-        print(f"  {timestamp} -> {temp}°C")
+        log.info("  %s -> %s°C", timestamp, temp)
     
     # Search for specific timestamp
     search_time = base_time + 120
-    print(f"\nTemperature at time {search_time}: {temp_log.search(search_time)}°C")
+    log.info("\nTemperature at time %s: %s°C", search_time, temp_log.search(search_time))
 
 
 def example_7_performance_comparison():
     """Example 7: Compare skip list vs list performance"""
-    print("\n" + "="*70)
-    print("EXAMPLE 7: Performance Comparison")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 7: Performance Comparison")
+    log.info("="*70 + "\n")
     
     import time
     
@@ -207,8 +208,10 @@ def example_7_performance_comparison():
     data = list(range(n))
     random.shuffle(data)
     
-    # Skip List
-    sl = SkipList()
+    # The integer-key variant only pays off when skip_list is compiled; in
+    # pure Python its key checks make it slightly slower than SkipList
+    compiled = not skip_list.__file__.endswith(".py")
+    sl = SkipList.for_ints() if compiled else SkipList()
     start = time.time()
     for num in data:
         sl.insert(num, num)
@@ -219,12 +222,11 @@ def example_7_performance_comparison():
         sl.search(random.randint(0, n))
     sl_search_time = time.time() - start
     
-    # Regular sorted list
+    # Regular sorted list, kept sorted on every insert
     sorted_list = []
     start = time.time()
     for num in data:
-        sorted_list.append(num)
-        sorted_list.sort()
+        bisect.insort(sorted_list, num)
     list_insert_time = time.time() - start
     
     start = time.time()
@@ -242,27 +244,27 @@ def example_7_performance_comparison():
                 right = mid - 1
     list_search_time = time.time() - start
     
-    print(f"Operations on {n} elements:")
-    print(f"\nInsertion (keeping sorted order):")
-    print(f"  Skip List: {sl_insert_time:.4f}s")
-    print(f"  Sorted List: {list_insert_time:.4f}s")
-    print(f"  Speedup: {list_insert_time/sl_insert_time:.2f}x")
+    log.info("Operations on %s elements:", n)
+    log.info("\nInsertion (keeping sorted order):")
+    log.info("  Skip List (%s): %.4fs", type(sl).__name__, sl_insert_time)
+    log.info("  Sorted List (bisect.insort): %.4fs", list_insert_time)
+    log.info("  Speedup: %.2fx", list_insert_time/sl_insert_time)
     
-    print(f"\nSearch (100 random searches):")
-    print(f"  Skip List: {sl_search_time:.4f}s")
-    print(f"  Binary Search: {list_search_time:.4f}s")
-    print(f"  Ratio: {sl_search_time/list_search_time:.2f}x")
+    log.info("\nSearch (100 random searches):")
+    log.info("  Skip List (%s): %.4fs", type(sl).__name__, sl_search_time)
+    log.info("  Binary Search: %.4fs", list_search_time)
+    log.info("  Ratio: %.2fx", sl_search_time/list_search_time)
 
 
 def example_8_concurrent_simulation():
     """Example 8: Simulate concurrent-like operations"""
-    print("\n" + "="*70)
-    print("EXAMPLE 8: Simulated Concurrent Operations")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("EXAMPLE 8: Simulated Concurrent Operations")
+    log.info("="*70 + "\n")
     
     sl = SkipList()
     
-    print("Simulating interleaved insert/delete operations:")
+    log.info("Simulating interleaved insert/delete operations:")
     operations = [
         ('insert', 5, 'five'),
         ('insert', 3, 'three'),
@@ -277,24 +279,24 @@ def example_8_concurrent_simulation():
     for op, key, value in operations:
         if op == 'insert':
             sl.insert(key, value)
-            print(f"  INSERT {key} -> {value}")
+            log.info("  INSERT %s -> %s", key, value)
         elif op == 'delete':
             result = sl.delete(key)
-            print(f"  DELETE {key} -> {'Success' if result else 'Failed'}")
+            log.info("  DELETE %s -> %s", key, 'Success' if result else 'Failed')
         elif op == 'search':
             result = sl.search(key)
-            print(f"  SEARCH {key} -> {result}")
+            log.info("  SEARCH %s -> %s", key, result)
     
-    print("\nFinal state:")
+    log.info("\nFinal state:")
     sl.display()
 
 
 def run_all_examples():
     """Run all examples"""
-    print("\n" + "="*70)
-    print("SKIP LIST USAGE EXAMPLES")
-    print("Assignment 359 - Topic 3")
-    print("="*70)
+    log.info("\n" + "="*70)
+    log.info("SKIP LIST USAGE EXAMPLES")
+    log.info("Assignment 359 - Topic 3")
+    log.info("="*70)
     
     random.seed(42)  # For reproducibility
     
@@ -307,11 +309,12 @@ def run_all_examples():
     example_7_performance_comparison()
     example_8_concurrent_simulation()
     
-    print("\n" + "="*70)
-    print("All examples completed!")
-    print("="*70 + "\n")
+    log.info("\n" + "="*70)
+    log.info("All examples completed!")
+    log.info("="*70 + "\n")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     run_all_examples()
 
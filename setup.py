@@ -0,0 +1,45 @@
+"""
+Optional build script for the compiled Skip List extensions.
+
+skip_list.py runs as-is on any Python 3.7+ interpreter. This script builds
+the optional accelerators in place:
+
+- _skiplist: a plain C skip list for integer keys, loaded with ctypes by
+  cskip_list.py. Only a C compiler is needed.
+- skip_list: when Cython is installed, skip_list.py itself is compiled
+  using the declarations in skip_list.pxd; the resulting extension module
+  shadows skip_list.py on import and keeps exactly the same API.
+- _tower: when Cython is installed, the tower row layout used by
+  visualization.py for integer keys.
+
+    $ pip install cython    # optional
+    $ python setup.py build_ext --inplace
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+ext_modules = [Extension("_skiplist", ["_skiplist.c"])]
+
+if cythonize is not None:
+    ext_modules += cythonize(
+        ["skip_list.py", "_tower.pyx"],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            # Types come from skip_list.pxd; annotations are documentation only
+            "annotation_typing": False,
+        },
+    )
+
+
+setup(
+    name="skip-list",
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,74 @@
+# Static type declarations for compiling skip_list.py with Cython.
+#
+# skip_list.py stays plain Python and is the only source of truth; this
+# file is picked up automatically by cythonize() and turns the node and
+# list classes into extension types with C-level attributes, so the hot
+# traversal loops read node.key / node.forward without dict lookups.
+# See setup.py for the build command.
+
+cimport cython
+from libc.stdint cimport int64_t
+
+
+@cython.locals(level=cython.int)
+cpdef int _random_level(int max_level, double p, double inv_log_p,
+                        getrandbits, rand)
+
+
+cdef class SkipNode:
+    cdef public object key
+    cdef public object value
+    cdef public list forward
+
+
+cdef class SkipList:
+    cdef public int max_level
+    cdef public double p
+    cdef public object header
+    cdef public int level
+    cdef Py_ssize_t _size
+    cdef list _update
+    cdef list _nones
+    cdef object _getrandbits
+    cdef object _rand
+    cdef double _inv_log_p
+
+    cpdef int random_level(self)
+
+    @cython.locals(grow=cython.int)
+    cpdef _grow(self, int level)
+
+    @cython.locals(max_level=cython.int, level=cython.int, i=cython.int,
+                   count=Py_ssize_t, last=list)
+    cpdef _link_sorted(self, list items)
+
+    @cython.locals(current=SkipNode, nxt=SkipNode, i=cython.int)
+    cpdef _find_predecessor(self, key)
+
+    @cython.locals(current=SkipNode, nxt=SkipNode, i=cython.int)
+    cpdef _find_update(self, key, list update)
+
+    cpdef search(self, key)
+
+    @cython.locals(update=list, i=cython.int, new_level=cython.int)
+    cpdef insert(self, key, value)
+
+    @cython.locals(update=list, i=cython.int)
+    cpdef bint delete(self, key)
+
+
+cdef class SkipNodeInt64:
+    cdef public int64_t key
+    cdef public object value
+    cdef public list forward
+
+
+cdef class SkipListInt64(SkipList):
+
+    @cython.locals(ikey=int64_t, current=SkipNodeInt64, nxt=SkipNodeInt64,
+                   i=cython.int)
+    cpdef _find_predecessor(self, key)
+
+    @cython.locals(ikey=int64_t, current=SkipNodeInt64, nxt=SkipNodeInt64,
+                   i=cython.int)
+    cpdef _find_update(self, key, list update)
@@ -8,16 +8,96 @@ complexity for search, insertion, and deletion operations.
 Reference: https://opendsa-server.cs.vt.edu/ODSA/Books/CS3/html/SkipList.html
 """
 
+import logging
+import math
 import random
+import sys
+from bisect import bisect_left, bisect_right
+from operator import index, itemgetter
 from typing import Optional, Any
 
 
+log = logging.getLogger(__name__)
+
+# Key range accepted by SkipListInt64
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def _check_probability(p: float) -> None:
+    """
+    Reject a level promotion probability outside (0, 1).
+    """
+    if not 0.0 < p < 1.0:
+        raise ValueError(f"p must be between 0 and 1, got {p}")
+
+
+def _check_max_level(max_level: int) -> None:
+    """
+    Reject a negative level cap.
+    """
+    if max_level < 0:
+        raise ValueError(f"max_level must be non-negative, got {max_level}")
+
+
+def _format_levels(title: str, levels) -> str:
+    """
+    Lay out a display() dump: a title banner, then one line per level.
+    
+    Args:
+        title: Heading line
+        levels: (level, cells) pairs from the top level down, where cells
+            are the texts shown inside [...] for each node on that level
+    
+    Returns:
+        The dump as a single string, ready to be logged as one record
+    """
+    lines = ["\n" + "="*60, title, "="*60]
+    for i, cells in levels:
+        parts = [f"Level {i}: "]
+        parts.extend(f"[{cell}] -> " for cell in cells)
+        parts.append("None")
+        lines.append("".join(parts))
+    lines.append("="*60 + "\n")
+    return "\n".join(lines)
+
+
+def _random_level(max_level: int, p: float, inv_log_p: float, getrandbits, rand) -> int:
+    """
+    Draw a geometric level with promotion probability p, capped at max_level.
+    Shared by SkipList and BSkipList.
+    
+    Args:
+        max_level: Highest level that may be returned
+        p: Probability for level promotion
+        inv_log_p: 1 / log(p), precomputed by the caller
+        getrandbits, rand: random.getrandbits and random.random, bound once
+            by the caller
+    
+    Returns:
+        Random level between 0 and max_level
+    """
+    if p == 0.5:
+        # Each bit is a fair coin flip, so the number of trailing zero
+        # bits of one random word is the geometric level we want
+        bits = getrandbits(max_level)
+        if bits == 0:
+            return max_level
+        return (bits & -bits).bit_length() - 1
+    
+    # Inverse transform sampling: P(level >= k) = p ** k
+    level = int(math.log(1.0 - rand()) * inv_log_p)
+    return level if level < max_level else max_level
+
+
 class SkipNode:
     """
     Node class for Skip List.
     Each node contains a key-value pair and forward pointers to next nodes at each level.
     """
     
+    __slots__ = ('key', 'value', 'forward')
+    
     def __init__(self, key: Any, value: Any, level: int):
         self.key = key
         self.value = value
@@ -33,18 +113,39 @@ class SkipList:
     Skip List implementation with insert, search, delete, and display operations.
     """
     
-    def __init__(self, max_level: int = 16, p: float = 0.5):
+    # Node type created by insert(); overridden by specialized subclasses
+    _node_class = SkipNode
+    
+    def __init__(self, max_level: int = 16, p: float = 1 / math.e):
         """
         Initialize skip list.
         
+        The default p = 1/e minimizes the expected number of key comparisons
+        per search (Kirschenhofer, Martinez and Prodinger), and also uses
+        fewer forward pointers than p = 0.5.
+        
         Args:
             max_level: Maximum number of levels in the skip list
-            p: Probability for level promotion (typically 0.5)
+            p: Probability for level promotion, between 0 and 1 exclusive
         """
+        _check_max_level(max_level)
+        _check_probability(p)
         self.max_level = max_level
         self.p = p
-        self.header = SkipNode(None, None, max_level)
+        # The header starts with a single level and grows with the tallest node
+        self.header = SkipNode(None, None, 0)
         self.level = 0  # Current maximum level in the skip list
+        self._size = 0  # Number of elements, maintained by insert/delete
+        # Scratch buffer reused by insert/delete to record, per level, the
+        # node whose forward pointer must be rewired; same length as the header
+        self._update = [None]
+        # All-None list of the same length, copied over _update to clear it
+        # without allocating
+        self._nones = [None]
+        # Bound once since random_level runs on every insert
+        self._getrandbits = random.getrandbits
+        self._rand = random.random
+        self._inv_log_p = 1.0 / math.log(p)
     
     def random_level(self) -> int:
         """
@@ -54,31 +155,135 @@ class SkipList:
         Returns:
             Random level between 0 and max_level
         """
-        level = 0
-        while random.random() < self.p and level < self.max_level:
-            level += 1
-        return level
+        return _random_level(self.max_level, self.p, self._inv_log_p,
+                             self._getrandbits, self._rand)
     
-    def search(self, key: Any) -> Optional[Any]:
+    @classmethod
+    def for_ints(cls, max_level: int = 16, p: float = 1 / math.e) -> "SkipListInt64":
         """
-        Search for a key in the skip list.
+        Create a skip list specialized for integer keys.
         
         Args:
-            key: Key to search for
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion
             
         Returns:
-            Value associated with the key if found, None otherwise
+            Empty SkipListInt64 instance
+        """
+        return SkipListInt64(max_level, p)
+    
+    @classmethod
+    def from_sorted(cls, items, max_level: int = 16, p: float = 1 / math.e) -> "SkipList":
+        """
+        Build a skip list from (key, value) pairs in O(n) for sorted input.
+        
+        Instead of drawing random levels, the i-th node (counting from 1)
+        gets a level equal to the number of trailing zero bits of i: every
+        2nd node reaches level 1, every 4th level 2, and so on. This gives
+        a perfectly balanced shape with no random draws or searches.
+        Unsorted input is sorted first; for duplicate keys the last value wins.
+        
+        Args:
+            items: Iterable of (key, value) pairs, ideally sorted by key
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion used by later inserts
+            
+        Returns:
+            New skip list containing the items
+        """
+        sl = cls(max_level, p)
+        # sorted() is linear on input that is already sorted
+        sl._link_sorted(sorted(items, key=itemgetter(0)))
+        return sl
+    
+    def _grow(self, level: int) -> None:
+        """
+        Make sure the header and the update buffer have room for level.
+        """
+        grow = level + 1 - len(self._update)
+        if grow > 0:
+            self.header.forward.extend([None] * grow)
+            self._update.extend([None] * grow)
+            self._nones.extend([None] * grow)
+    
+    def _link_sorted(self, items: list) -> None:
+        """
+        Append sorted (key, value) pairs to an empty skip list (see from_sorted).
+        """
+        node_class = self._node_class
+        max_level = self.max_level
+        last = [self.header]  # Most recent node reaching each level
+        node = None
+        count = 0
+        
+        for key, value in items:
+            if node is not None and node.key == key:
+                node.value = value
+                continue
+            
+            count += 1
+            level = (count & -count).bit_length() - 1
+            if level > max_level:
+                level = max_level
+            if level >= len(last):
+                self._grow(level)
+                last.extend([self.header] * (level + 1 - len(last)))
+            
+            node = node_class(key, value, level)
+            for i in range(level + 1):
+                last[i].forward[i] = node
+                last[i] = node
+        
+        self.level = len(last) - 1
+        self._size = count
+    
+    def _find_predecessor(self, key: Any) -> SkipNode:
+        """
+        Find the last node whose key is less than the given key.
+        
+        Returns:
+            The level-0 predecessor of key (the header if there is none)
         """
         current = self.header
         
         # Start from highest level and move down
         for i in range(self.level, -1, -1):
-            # Move forward while the next node's key is less than search key
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
+            # Move forward while the next node's key is less than search key.
+            # The inline < is deliberate: it beats calling operator.lt here.
+            nxt = current.forward[i]
+            while nxt is not None and nxt.key < key:
+                current = nxt
+                nxt = current.forward[i]
+        return current
+    
+    def _find_update(self, key: Any, update: list) -> SkipNode:
+        """
+        Like _find_predecessor, but also record in update[i] the last node
+        visited at each level i, i.e. the nodes whose forward pointers have
+        to be rewired by an insertion or deletion.
+        """
+        current = self.header
+        
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt.key < key:
+                current = nxt
+                nxt = current.forward[i]
+            update[i] = current
+        return current
+    
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Search for a key in the skip list.
         
+        Args:
+            key: Key to search for
+            
+        Returns:
+            Value associated with the key if found, None otherwise
+        """
         # Move to the next node at level 0
-        current = current.forward[0]
+        current = self._find_predecessor(key).forward[0]
         
         # Check if we found the key
         if current and current.key == key:
@@ -93,17 +298,10 @@ class SkipList:
             key: Key to insert
             value: Value associated with the key
         """
-        update = [None] * (self.max_level + 1)
-        current = self.header
+        update = self._update
         
-        # Find the position to insert
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current
-        
-        # Move to level 0
-        current = current.forward[0]
+        # Find the position to insert, then move to level 0
+        current = self._find_update(key, update).forward[0]
         
         # If key already exists, update the value
         if current and current.key == key:
@@ -114,17 +312,34 @@ class SkipList:
             
             # If new level is greater than current level, update header pointers
             if new_level > self.level:
+                self._grow(new_level)
                 for i in range(self.level + 1, new_level + 1):
                     update[i] = self.header
                 self.level = new_level
             
             # Create new node
-            new_node = SkipNode(key, value, new_level)
+            new_node = self._node_class(key, value, new_level)
             
             # Insert node by updating forward pointers
             for i in range(new_level + 1):
                 new_node.forward[i] = update[i].forward[i]
                 update[i].forward[i] = new_node
+            self._size += 1
+        
+        # Release the nodes recorded during the descent
+        update[:] = self._nones
+    
+    def insert_many(self, items) -> None:
+        """
+        Insert (key, value) pairs from an iterable, in any order.
+        
+        Args:
+            items: Iterable of (key, value) pairs; a repeated key keeps the
+                last value, as with repeated insert() calls
+        """
+        insert = self.insert
+        for key, value in items:
+            insert(key, value)
     
     def delete(self, key: Any) -> bool:
         """
@@ -136,74 +351,108 @@ class SkipList:
         Returns:
             True if key was found and deleted, False otherwise
         """
-        update = [None] * (self.max_level + 1)
-        current = self.header
+        update = self._update
         
         # Find the node to delete
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current
+        current = self._find_update(key, update).forward[0]
         
-        current = current.forward[0]
+        # Key not present: nothing to unlink, just release the recorded nodes
+        if current is None or current.key != key:
+            update[:] = self._nones
+            return False
         
-        # If key found, delete it
-        if current and current.key == key:
-            # Update forward pointers
-            for i in range(self.level + 1):
-                if update[i].forward[i] != current:
-                    break
-                update[i].forward[i] = current.forward[i]
-            
-            # Update level if necessary
-            while self.level > 0 and self.header.forward[self.level] is None:
-                self.level -= 1
-            
-            return True
+        # Update forward pointers
+        for i in range(self.level + 1):
+            if update[i].forward[i] != current:
+                break
+            update[i].forward[i] = current.forward[i]
+        self._size -= 1
         
-        return False
+        # Release the nodes recorded during the descent
+        update[:] = self._nones
+        
+        # Update level if necessary
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+        
+        return True
     
     def display(self) -> None:
         """
         Display the skip list structure level by level.
+        Output goes to this module's logger at INFO level, so it costs
+        nothing unless logging is configured to show it.
         """
-        print("\n" + "="*60)
-        print("Skip List Structure:")
-        print("="*60)
+        if not log.isEnabledFor(logging.INFO):
+            return
         
+        levels = []
         for i in range(self.level, -1, -1):
-            print(f"Level {i}: ", end="")
+            cells = []
             node = self.header.forward[i]
-            while node:
-                print(f"[{node.key}:{node.value}]", end=" -> ")
+            while node is not None:
+                cells.append(f"{node.key}:{node.value}")
                 node = node.forward[i]
-            print("None")
-        print("="*60 + "\n")
+            levels.append((i, cells))
+        
+        # Emit the whole structure as a single record
+        log.info(_format_levels("Skip List Structure:", levels))
     
     def get_all_items(self) -> list:
         """
         Get all key-value pairs in sorted order.
         
+        Returns:
+            List of (key, value) tuples in sorted order
+        """
+        return list(self)
+    
+    def items_in_range(self, lo: Any, hi: Any) -> list:
+        """
+        Get all key-value pairs with lo <= key <= hi in sorted order.
+        Descends the express lanes to lo, then walks level 0 up to hi,
+        so the cost is O(log n + k) for k matching items.
+        
+        Args:
+            lo: Lower bound (inclusive)
+            hi: Upper bound (inclusive)
+            
         Returns:
             List of (key, value) tuples in sorted order
         """
         items = []
-        current = self.header.forward[0]
-        while current:
-            items.append((current.key, current.value))
-            current = current.forward[0]
+        node = self._find_predecessor(lo).forward[0]
+        while node is not None and node.key <= hi:
+            items.append((node.key, node.value))
+            node = node.forward[0]
         return items
     
+    def __iter__(self):
+        """
+        Iterate over (key, value) pairs in sorted order without building a list.
+        """
+        node = self.header.forward[0]
+        while node is not None:
+            yield (node.key, node.value)
+            node = node.forward[0]
+    
+    def nodes(self):
+        """
+        Iterate over the level-0 nodes themselves in sorted order.
+        
+        Used by the visualizers, which need each node's tower and identity
+        rather than its (key, value) pair.
+        """
+        node = self.header.forward[0]
+        while node is not None:
+            yield node
+            node = node.forward[0]
+    
     def __len__(self) -> int:
         """
         Return the number of elements in the skip list.
         """
-        count = 0
-        current = self.header.forward[0]
-        while current:
-            count += 1
-            current = current.forward[0]
-        return count
+        return self._size
     
     def __contains__(self, key: Any) -> bool:
         """
@@ -216,79 +465,491 @@ class SkipList:
         return f"SkipList({items})"
 
 
+class SkipNodeInt64:
+    """
+    Skip List node holding an integer key.
+    When compiled with Cython the key is stored as a C int64.
+    """
+    
+    __slots__ = ('key', 'value', 'forward')
+    
+    def __init__(self, key: int, value: Any, level: int):
+        # Store the plain int (True becomes 1), as the compiled build does.
+        # from_sorted builds nodes without a search, so check the range here
+        key = index(key)
+        if not INT64_MIN <= key <= INT64_MAX:
+            raise OverflowError(f"key {key} does not fit in a signed 64-bit integer")
+        self.key = key
+        self.value = value
+        # Forward pointers for each level
+        self.forward = [None] * (level + 1)
+    
+    def __repr__(self):
+        return f"SkipNodeInt64(key={self.key}, value={self.value})"
+
+
+class SkipListInt64(SkipList):
+    """
+    Skip List specialized for integer keys in the int64 range.
+    
+    The API is identical to SkipList. In the compiled build the traversal
+    loops compare C int64 keys directly instead of going through Python's
+    rich comparison; in pure Python it behaves exactly like SkipList, except
+    that non-integer keys are rejected with TypeError and keys outside the
+    int64 range with OverflowError, as in the compiled build.
+    """
+    
+    _node_class = SkipNodeInt64
+    
+    def __init__(self, max_level: int = 16, p: float = 1 / math.e):
+        super().__init__(max_level, p)
+        self.header = SkipNodeInt64(0, None, 0)
+    
+    def _find_predecessor(self, key: int) -> SkipNodeInt64:
+        ikey = index(key)
+        if not INT64_MIN <= ikey <= INT64_MAX:
+            raise OverflowError(f"key {ikey} does not fit in a signed 64-bit integer")
+        current = self.header
+        
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt.key < ikey:
+                current = nxt
+                nxt = current.forward[i]
+        return current
+    
+    def _find_update(self, key: int, update: list) -> SkipNodeInt64:
+        ikey = index(key)
+        if not INT64_MIN <= ikey <= INT64_MAX:
+            raise OverflowError(f"key {ikey} does not fit in a signed 64-bit integer")
+        current = self.header
+        
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt.key < ikey:
+                current = nxt
+                nxt = current.forward[i]
+            update[i] = current
+        return current
+
+
+class BlockNode:
+    """
+    Node class for BSkipList.
+    Holds a sorted block of keys with their values, plus forward pointers.
+    """
+    
+    __slots__ = ('keys', 'values', 'forward')
+    
+    def __init__(self, keys: list, values: list, level: int):
+        self.keys = keys
+        self.values = values
+        # Forward pointers for each level
+        self.forward = [None] * (level + 1)
+    
+    def __repr__(self):
+        return f"BlockNode(keys={self.keys})"
+
+
+class BSkipList:
+    """
+    B-skip-list: a skip list whose nodes are sorted blocks of keys.
+    
+    Each block holds between block_size // 2 and 2 * block_size keys (a
+    lone block may hold fewer) in contiguous lists, and the express lanes index blocks by their first
+    key. A lookup descends O(log(n / B)) blocks and then bisects inside
+    one block; scans and range queries walk whole blocks at a time.
+    
+    Supports SkipList's dictionary-style interface (from_sorted, search,
+    insert, insert_many, delete, items_in_range, get_all_items, display,
+    iteration, len() and ``in``). Keys do not have nodes of their own, so
+    there is no nodes() or for_ints(), and visualization.py does not apply.
+    """
+    
+    def __init__(self, block_size: int = 16, max_level: int = 16, p: float = 1 / math.e):
+        """
+        Initialize skip list.
+        
+        Args:
+            block_size: Target number of keys per block (B)
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion, between 0 and 1 exclusive
+        """
+        if block_size < 2:
+            raise ValueError(f"block_size must be at least 2, got {block_size}")
+        _check_max_level(max_level)
+        _check_probability(p)
+        self.block_size = block_size
+        self.max_level = max_level
+        self.p = p
+        self.header = BlockNode([], [], max_level)
+        self.level = 0  # Current maximum level in the skip list
+        self._size = 0  # Number of elements, maintained by insert/delete
+        self._getrandbits = random.getrandbits
+        self._rand = random.random
+        self._inv_log_p = 1.0 / math.log(p)
+    
+    @classmethod
+    def from_sorted(cls, items, block_size: int = 16, max_level: int = 16,
+                    p: float = 1 / math.e) -> "BSkipList":
+        """
+        Build a block skip list from (key, value) pairs.
+        
+        Args:
+            items: Iterable of (key, value) pairs; a repeated key keeps the
+                last value
+            block_size: Target number of keys per block (B)
+            max_level: Maximum number of levels in the skip list
+            p: Probability for level promotion, between 0 and 1 exclusive
+        
+        Returns:
+            A new block skip list holding the pairs
+        """
+        sl = cls(block_size, max_level, p)
+        sl.insert_many(sorted(items, key=itemgetter(0)))
+        return sl
+    
+    def random_level(self) -> int:
+        """
+        Generate a random level for a new block.
+        
+        Returns:
+            Random level between 0 and max_level
+        """
+        return _random_level(self.max_level, self.p, self._inv_log_p,
+                             self._getrandbits, self._rand)
+    
+    def _find_block(self, key: Any) -> BlockNode:
+        """
+        Find the last block whose first key is <= key (the header if none).
+        """
+        current = self.header
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt.keys[0] <= key:
+                current = nxt
+                nxt = current.forward[i]
+        return current
+    
+    def _link(self, block: BlockNode) -> None:
+        """
+        Splice a new block into every level it reaches.
+        """
+        level = len(block.forward) - 1
+        first = block.keys[0]
+        update = [self.header] * (level + 1)
+        current = self.header
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt.keys[0] < first:
+                current = nxt
+                nxt = current.forward[i]
+            if i <= level:
+                update[i] = current
+        
+        for i in range(level + 1):
+            block.forward[i] = update[i].forward[i]
+            update[i].forward[i] = block
+        if level > self.level:
+            self.level = level
+    
+    def _unlink(self, block: BlockNode, first: Any) -> None:
+        """
+        Remove a block, whose first key is (or was) first, from every level.
+        """
+        current = self.header
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt is not block and nxt.keys[0] < first:
+                current = nxt
+                nxt = current.forward[i]
+            if nxt is block:
+                current.forward[i] = block.forward[i]
+        
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+    
+    def _predecessor(self, block: BlockNode, first: Any) -> BlockNode:
+        """
+        Find the block linked just before block, whose first key is (or
+        was) first; the header if block is the first one.
+        """
+        current = self.header
+        for i in range(self.level, -1, -1):
+            nxt = current.forward[i]
+            while nxt is not None and nxt is not block and nxt.keys[0] < first:
+                current = nxt
+                nxt = current.forward[i]
+        return current
+    
+    def _rebalance(self, block: BlockNode, first: Any) -> None:
+        """
+        Refill an underfull block, whose first key was first, from its
+        successor (or its predecessor if it is the last block): merge the
+        two when they fit in one block, else share their keys evenly.
+        """
+        if block.forward[0] is not None:
+            left, right = block, block.forward[0]
+        else:
+            left, right = self._predecessor(block, first), block
+            if left is self.header:
+                # A lone block may be small
+                return
+        
+        if len(left.keys) + len(right.keys) <= 2 * self.block_size:
+            right_first = right.keys[0]
+            left.keys.extend(right.keys)
+            left.values.extend(right.values)
+            self._unlink(right, right_first)
+        else:
+            # Only first keys are indexed, and both stay between the keys
+            # of the surrounding blocks, so no level needs relinking
+            keys = left.keys + right.keys
+            values = left.values + right.values
+            mid = len(keys) // 2
+            left.keys, right.keys = keys[:mid], keys[mid:]
+            left.values, right.values = values[:mid], values[mid:]
+    
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Search for a key in the skip list.
+        
+        Args:
+            key: Key to search for
+            
+        Returns:
+            Value associated with the key if found, None otherwise
+        """
+        block = self._find_block(key)
+        keys = block.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return block.values[i]
+        return None
+    
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Insert a key-value pair into the skip list.
+        
+        Args:
+            key: Key to insert
+            value: Value associated with the key
+        """
+        block = self._find_block(key)
+        if block is self.header:
+            # Smaller than every first key: goes to the front of the first block
+            block = self.header.forward[0]
+            if block is None:
+                self._link(BlockNode([key], [value], self.random_level()))
+                self._size = 1
+                return
+        
+        keys = block.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            block.values[i] = value
+            return
+        keys.insert(i, key)
+        block.values.insert(i, value)
+        self._size += 1
+        
+        # Split overfull blocks in half
+        if len(keys) > 2 * self.block_size:
+            mid = len(keys) // 2
+            self._link(BlockNode(keys[mid:], block.values[mid:], self.random_level()))
+            del keys[mid:]
+            del block.values[mid:]
+    
+    def insert_many(self, items) -> None:
+        """
+        Insert (key, value) pairs from an iterable, in any order.
+        
+        Args:
+            items: Iterable of (key, value) pairs; a repeated key keeps the
+                last value, as with repeated insert() calls
+        """
+        insert = self.insert
+        for key, value in items:
+            insert(key, value)
+    
+    def delete(self, key: Any) -> bool:
+        """
+        Delete a key from the skip list.
+        
+        Args:
+            key: Key to delete
+            
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        block = self._find_block(key)
+        keys = block.keys
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return False
+        
+        first = keys[0]
+        del keys[i]
+        del block.values[i]
+        self._size -= 1
+        
+        if not keys:
+            self._unlink(block, first)
+        elif len(keys) < self.block_size // 2:
+            self._rebalance(block, first)
+        return True
+    
+    def display(self) -> None:
+        """
+        Display the skip list structure level by level, one [...] per block.
+        Like SkipList.display, output goes to the logger at INFO level.
+        """
+        if not log.isEnabledFor(logging.INFO):
+            return
+        
+        levels = []
+        for i in range(self.level, -1, -1):
+            cells = []
+            block = self.header.forward[i]
+            while block is not None:
+                cells.append(", ".join(f"{k}:{v}" for k, v in zip(block.keys, block.values)))
+                block = block.forward[i]
+            levels.append((i, cells))
+        
+        log.info(_format_levels("B-Skip List Structure:", levels))
+    
+    def get_all_items(self) -> list:
+        """
+        Get all key-value pairs in sorted order.
+        
+        Returns:
+            List of (key, value) tuples in sorted order
+        """
+        return list(self)
+    
+    def items_in_range(self, lo: Any, hi: Any) -> list:
+        """
+        Get all key-value pairs with lo <= key <= hi in sorted order.
+        
+        Args:
+            lo: Lower bound (inclusive)
+            hi: Upper bound (inclusive)
+            
+        Returns:
+            List of (key, value) tuples in sorted order
+        """
+        items = []
+        block = self._find_block(lo)
+        start = bisect_left(block.keys, lo)
+        while block is not None:
+            keys = block.keys
+            end = bisect_right(keys, hi)
+            items.extend(zip(keys[start:end], block.values[start:end]))
+            if end < len(keys):
+                break
+            block = block.forward[0]
+            start = 0
+        return items
+    
+    def __iter__(self):
+        """
+        Iterate over (key, value) pairs in sorted order.
+        """
+        block = self.header.forward[0]
+        while block is not None:
+            yield from zip(block.keys, block.values)
+            block = block.forward[0]
+    
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the skip list.
+        """
+        return self._size
+    
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if a key exists in the skip list.
+        """
+        return self.search(key) is not None
+    
+    def __repr__(self):
+        return f"BSkipList({self.get_all_items()})"
+
+
 def demo_skip_list():
     """
     Demonstration of skip list operations.
     """
-    print("\n" + "="*60)
-    print("SKIP LIST DEMONSTRATION")
-    print("="*60 + "\n")
+    log.info("\n" + "="*60)
+    log.info("SKIP LIST DEMONSTRATION")
+    log.info("="*60 + "\n")
     
     # Create a skip list
     sl = SkipList(max_level=4, p=0.5)
     
     # Test insertions
-    print("1. INSERTION TEST")
-    print("-" * 60)
+    log.info("1. INSERTION TEST")
+    log.info("-" * 60)
     test_data = [(3, "three"), (6, "six"), (7, "seven"), (9, "nine"), 
                  (12, "twelve"), (19, "nineteen"), (17, "seventeen"), 
                  (26, "twenty-six"), (21, "twenty-one"), (25, "twenty-five")]
     
     for key, value in test_data:
-        print(f"Inserting: {key} -> {value}")
+        log.info("Inserting: %s -> %s", key, value)
         sl.insert(key, value)
     
     sl.display()
-    print(f"Total elements: {len(sl)}\n")
+    log.info("Total elements: %s\n", len(sl))
     
     # Test search
-    print("2. SEARCH TEST")
-    print("-" * 60)
+    log.info("2. SEARCH TEST")
+    log.info("-" * 60)
     search_keys = [7, 19, 100, 3]
     for key in search_keys:
         result = sl.search(key)
         if result:
-            print(f"Found: {key} -> {result}")
+            log.info("Found: %s -> %s", key, result)
         else:
-            print(f"Not found: {key}")
-    print()
+            log.info("Not found: %s", key)
+    log.info("")
     
     # Test contains
-    print("3. MEMBERSHIP TEST")
-    print("-" * 60)
-    print(f"Is 12 in skip list? {12 in sl}")
-    print(f"Is 50 in skip list? {50 in sl}")
-    print()
+    log.info("3. MEMBERSHIP TEST")
+    log.info("-" * 60)
+    log.info("Is 12 in skip list? %s", 12 in sl)
+    log.info("Is 50 in skip list? %s", 50 in sl)
+    log.info("")
     
     # Test deletion
-    print("4. DELETION TEST")
-    print("-" * 60)
+    log.info("4. DELETION TEST")
+    log.info("-" * 60)
     delete_keys = [19, 7, 100]
     for key in delete_keys:
         result = sl.delete(key)
-        print(f"Delete {key}: {'Success' if result else 'Failed (not found)'}")
+        log.info("Delete %s: %s", key, 'Success' if result else 'Failed (not found)')
     
     sl.display()
-    print(f"Total elements: {len(sl)}\n")
+    log.info("Total elements: %s\n", len(sl))
     
     # Show sorted order
-    print("5. SORTED ORDER")
-    print("-" * 60)
-    print("All items in sorted order:")
+    log.info("5. SORTED ORDER")
+    log.info("-" * 60)
+    log.info("All items in sorted order:")
     for key, value in sl.get_all_items():
-        print(f"  {key} -> {value}")
-    print()
+        log.info("  %s -> %s", key, value)
+    log.info("")
     
     # Test update
-    print("6. UPDATE TEST")
-    print("-" * 60)
-    print("Updating key 12 with new value 'TWELVE'")
+    log.info("6. UPDATE TEST")
+    log.info("-" * 60)
+    log.info("Updating key 12 with new value 'TWELVE'")
     sl.insert(12, "TWELVE")
-    print(f"Value for key 12: {sl.search(12)}")
+    log.info("Value for key 12: %s", sl.search(12))
     sl.display()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Set seed for reproducibility
     random.seed(42)
     demo_skip_list()
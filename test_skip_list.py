@@ -2,9 +2,15 @@
 Unit tests for Skip List implementation
 """
 
+import io
+import math
 import unittest
 import random
-from skip_list import SkipList, SkipNode
+from skip_list import BSkipList, SkipList, SkipListInt64, SkipNode
+import cskip_list
+from cskip_list import CSkipList
+import visualization
+from visualization import visualize_skip_list_compact, visualize_skip_list_detailed
 
 
 class TestSkipNode(unittest.TestCase):
@@ -21,6 +27,11 @@ class TestSkipNode(unittest.TestCase):
         """Test that forward pointers are initialized to None"""
         node = SkipNode(10, "ten", 2)
         self.assertTrue(all(ptr is None for ptr in node.forward))
+    
+    def test_node_has_no_instance_dict(self):
+        """Test that nodes use slots instead of a per-instance __dict__"""
+        node = SkipNode(1, "one", 0)
+        self.assertFalse(hasattr(node, "__dict__"))
 
 
 class TestSkipList(unittest.TestCase):
@@ -65,6 +76,86 @@ class TestSkipList(unittest.TestCase):
         sorted_keys = [item[0] for item in items]
         self.assertEqual(sorted_keys, sorted(keys))
     
+    def test_iteration(self):
+        """Test iterating over the skip list yields sorted (key, value) pairs"""
+        for key in [4, 1, 3, 2]:
+            self.sl.insert(key, str(key))
+        
+        self.assertEqual(list(self.sl), [(1, "1"), (2, "2"), (3, "3"), (4, "4")])
+        self.assertEqual(list(self.sl), self.sl.get_all_items())
+
+    def test_nodes(self):
+        """Test iterating over the level-0 nodes"""
+        for key in [4, 1, 3, 2]:
+            self.sl.insert(key, str(key))
+
+        nodes = list(self.sl.nodes())
+        self.assertTrue(all(isinstance(node, SkipNode) for node in nodes))
+        self.assertEqual([node.key for node in nodes], [1, 2, 3, 4])
+        self.assertIs(nodes[0], self.sl.header.forward[0])
+
+    def test_node_forward_sized_to_tower(self):
+        """Test that each node has one forward pointer per level it is linked on"""
+        for key in random.sample(range(1000), 200):
+            self.sl.insert(key, key)
+        for key in random.sample(range(1000), 300):
+            self.sl.delete(key)
+
+        heights = {}
+        for level in range(self.sl.level + 1):
+            node = self.sl.header.forward[level]
+            while node is not None:
+                heights[id(node)] = level
+                node = node.forward[level]
+        self.assertEqual([len(node.forward) - 1 for node in self.sl.nodes()],
+                         [heights[id(node)] for node in self.sl.nodes()])
+
+    def test_items_in_range(self):
+        """Test range queries with inclusive bounds"""
+        for key in range(0, 100, 5):
+            self.sl.insert(key, str(key))
+        
+        self.assertEqual(self.sl.items_in_range(30, 45),
+                         [(30, "30"), (35, "35"), (40, "40"), (45, "45")])
+        self.assertEqual([k for k, _ in self.sl.items_in_range(31, 44)], [35, 40])
+        self.assertEqual([k for k, _ in self.sl.items_in_range(-10, 7)], [0, 5])
+        self.assertEqual([k for k, _ in self.sl.items_in_range(93, 200)], [95])
+        self.assertEqual(self.sl.items_in_range(41, 44), [])
+        self.assertEqual(self.sl.items_in_range(60, 30), [])
+    
+    def test_from_sorted(self):
+        """Test bulk loading from sorted pairs"""
+        data = [(i, str(i)) for i in range(1, 101)]
+        sl = SkipList.from_sorted(data, max_level=4)
+        
+        self.assertEqual(len(sl), 100)
+        self.assertEqual(sl.get_all_items(), data)
+        self.assertEqual(sl.level, 4)
+        self.assertEqual(sl.search(64), "64")
+        
+        # Level i holds every 2**i-th node (capped at max_level)
+        for level in range(4):
+            keys = []
+            node = sl.header.forward[level]
+            while node is not None:
+                keys.append(node.key)
+                node = node.forward[level]
+            self.assertEqual(keys, list(range(2 ** level, 101, 2 ** level)))
+        
+        # The result is a normal skip list afterwards
+        sl.insert(0, "0")
+        self.assertTrue(sl.delete(50))
+        self.assertEqual(len(sl), 100)
+        self.assertEqual(sl.get_all_items()[:2], [(0, "0"), (1, "1")])
+    
+    def test_from_sorted_unsorted_and_duplicates(self):
+        """Test bulk loading sorts its input and keeps the last duplicate"""
+        sl = SkipList.from_sorted([(3, "c"), (1, "a"), (2, "b"), (1, "A")])
+        self.assertEqual(sl.get_all_items(), [(1, "A"), (2, "b"), (3, "c")])
+        self.assertEqual(len(sl), 3)
+        
+        self.assertEqual(len(SkipList.from_sorted([])), 0)
+    
     def test_update_existing_key(self):
         """Test updating value for existing key"""
         self.sl.insert(5, "five")
@@ -74,6 +165,40 @@ class TestSkipList(unittest.TestCase):
         self.assertEqual(self.sl.search(5), "FIVE")
         self.assertEqual(len(self.sl), 1)  # Length should not change
     
+    def test_update_keeps_structure(self):
+        """Test that updating an existing key does not relink any nodes"""
+        for key in range(20):
+            self.sl.insert(key, str(key))
+        
+        def links():
+            result = []
+            node = self.sl.header
+            while node is not None:
+                result.append([id(ptr) for ptr in node.forward])
+                node = node.forward[0]
+            return result
+        
+        level, before = self.sl.level, links()
+        for key in range(20):
+            self.sl.insert(key, key)
+        
+        self.assertEqual(self.sl.level, level)
+        self.assertEqual(links(), before)
+        self.assertEqual(self.sl.get_all_items(), [(k, k) for k in range(20)])
+    
+    def test_update_buffer_cleared(self):
+        """Test that insert and delete leave no nodes in the scratch buffer"""
+        if not hasattr(self.sl, "_update"):
+            self.skipTest("scratch buffer is not visible in the compiled build")
+        for key in range(50):
+            self.sl.insert(key, key)
+        self.sl.delete(10)
+        self.sl.delete(100)
+        
+        self.assertEqual(len(self.sl._update), len(self.sl.header.forward))
+        self.assertEqual(self.sl._update, [None] * len(self.sl.header.forward))
+        self.assertEqual(self.sl._nones, [None] * len(self.sl.header.forward))
+    
     def test_search_nonexistent_key(self):
         """Test searching for nonexistent key"""
         self.sl.insert(5, "five")
@@ -153,6 +278,13 @@ class TestSkipList(unittest.TestCase):
         self.assertEqual(len(self.sl), 1)
         self.assertEqual(self.sl.search(5), "five")
     
+    def test_insert_many(self):
+        """Test bulk insertion from an unsorted iterable"""
+        self.sl.insert_many((k, str(k)) for k in [7, 3, 9, 3, 1])
+        
+        self.assertEqual(len(self.sl), 4)
+        self.assertEqual(self.sl.get_all_items(), [(1, "1"), (3, "3"), (7, "7"), (9, "9")])
+    
     def test_random_operations(self):
         """Test random sequence of operations"""
         random.seed(123)
@@ -201,6 +333,290 @@ class TestSkipList(unittest.TestCase):
         self.assertEqual(sorted_words, sorted(words))
 
 
+class TestSkipListInt64(unittest.TestCase):
+    """Test cases for the integer-key specialization"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        random.seed(42)
+        self.sl = SkipList.for_ints(max_level=4, p=0.5)
+    
+    def test_factory(self):
+        """Test that for_ints returns the specialized class"""
+        self.assertIsInstance(self.sl, SkipListInt64)
+        self.assertIsInstance(self.sl, SkipList)
+    
+    def test_basic_operations(self):
+        """Test insert, search, update and delete with integer keys"""
+        keys = list(range(-50, 50))
+        random.shuffle(keys)
+        for key in keys:
+            self.sl.insert(key, str(key))
+        
+        self.assertEqual(len(self.sl), 100)
+        self.assertEqual([k for k, _ in self.sl.get_all_items()], sorted(keys))
+        self.assertEqual(self.sl.search(-7), "-7")
+        self.assertIsNone(self.sl.search(1000))
+        
+        self.sl.insert(3, "THREE")
+        self.assertEqual(self.sl.search(3), "THREE")
+        self.assertEqual(len(self.sl), 100)
+        
+        self.assertTrue(self.sl.delete(3))
+        self.assertFalse(self.sl.delete(3))
+        self.assertNotIn(3, self.sl)
+    
+    def test_non_integer_key(self):
+        """Test that non-integer keys are rejected"""
+        with self.assertRaises(TypeError):
+            self.sl.insert("five", 5)
+        with self.assertRaises(TypeError):
+            self.sl.search(2.5)
+    
+    def test_bool_key_stored_as_int(self):
+        """Test that keys are stored as plain ints, as in the compiled build"""
+        self.sl.insert(True, "t")
+        self.assertEqual(self.sl.get_all_items(), [(1, "t")])
+        self.assertIs(type(self.sl.get_all_items()[0][0]), int)
+
+
+class TestBSkipList(unittest.TestCase):
+    """Test cases for the block-based BSkipList"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        random.seed(42)
+        # Small blocks so that splits and merges happen often
+        self.sl = BSkipList(block_size=4, max_level=6)
+    
+    def test_empty_skip_list(self):
+        """Test empty skip list"""
+        self.assertEqual(len(self.sl), 0)
+        self.assertIsNone(self.sl.search(1))
+        self.assertFalse(self.sl.delete(1))
+        self.assertEqual(self.sl.get_all_items(), [])
+        self.assertEqual(self.sl.items_in_range(0, 10), [])
+    
+    def test_block_sizes(self):
+        """Test that blocks split and merge within their size bounds"""
+        for key in range(100):
+            self.sl.insert(key, str(key))
+        
+        def block_sizes():
+            sizes = []
+            block = self.sl.header.forward[0]
+            while block is not None:
+                sizes.append(len(block.keys))
+                block = block.forward[0]
+            return sizes
+        
+        # Deleting from the front, the back and at random all keep every
+        # block within [B // 2, 2B] while more than one is left
+        for keys in (range(0, 100, 3), range(99, 60, -1), random.sample(range(100), 100)):
+            for key in keys:
+                self.sl.delete(key)
+                sizes = block_sizes()
+                self.assertEqual(sum(sizes), len(self.sl))
+                self.assertTrue(all(size <= 8 for size in sizes))
+                if len(sizes) > 1:
+                    self.assertTrue(all(size >= 2 for size in sizes), sizes)
+        self.assertEqual(block_sizes(), [])
+    
+    def test_random_operations(self):
+        """Test random operations against a dict"""
+        expected = {}
+        for _ in range(2000):
+            key = random.randint(0, 300)
+            op = random.random()
+            if op < 0.5:
+                self.sl.insert(key, str(key))
+                expected[key] = str(key)
+            elif op < 0.8:
+                self.assertEqual(self.sl.delete(key), key in expected)
+                expected.pop(key, None)
+            else:
+                self.assertEqual(self.sl.search(key), expected.get(key))
+        
+        items = sorted(expected.items())
+        self.assertEqual(len(self.sl), len(expected))
+        self.assertEqual(self.sl.get_all_items(), items)
+        self.assertEqual(self.sl.items_in_range(50, 150),
+                         [(k, v) for k, v in items if 50 <= k <= 150])
+    
+    def test_update_and_smallest_key(self):
+        """Test updating values and inserting in front of the first block"""
+        for key in range(10, 20):
+            self.sl.insert(key, "old")
+        self.sl.insert(15, "new")
+        self.sl.insert(1, "one")
+        
+        self.assertEqual(len(self.sl), 11)
+        self.assertEqual(self.sl.search(15), "new")
+        self.assertEqual(self.sl.get_all_items()[0], (1, "one"))
+        self.assertIn(1, self.sl)
+    
+    def test_bulk_loading(self):
+        """Test from_sorted and insert_many"""
+        sl = BSkipList.from_sorted([(k, str(k)) for k in range(100, 0, -1)], block_size=4)
+        self.assertEqual(sl.get_all_items(), [(k, str(k)) for k in range(1, 101)])
+        
+        sl.insert_many([(0, "zero"), (50, "fifty")])
+        self.assertEqual(len(sl), 101)
+        self.assertEqual(sl.search(50), "fifty")
+        self.assertEqual(sl.get_all_items()[0], (0, "zero"))
+
+
+class TestCSkipList(unittest.TestCase):
+    """Test cases for CSkipList (C library, or its pure Python fallback)"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        random.seed(42)
+        self.sl = CSkipList(max_level=8, p=0.5)
+    
+    def test_basic_operations(self):
+        """Test insert, search, update and delete"""
+        keys = list(range(200))
+        random.shuffle(keys)
+        for key in keys:
+            self.sl.insert(key, str(key))
+        
+        self.assertEqual(len(self.sl), 200)
+        self.assertEqual(self.sl.get_all_items(), [(k, str(k)) for k in range(200)])
+        self.assertEqual(self.sl.search(42), "42")
+        self.assertIsNone(self.sl.search(500))
+        
+        self.sl.insert(42, "FORTY-TWO")
+        self.assertEqual(self.sl.search(42), "FORTY-TWO")
+        self.assertEqual(len(self.sl), 200)
+        
+        for key in range(0, 200, 2):
+            self.assertTrue(self.sl.delete(key))
+        self.assertFalse(self.sl.delete(0))
+        self.assertEqual(len(self.sl), 100)
+        self.assertNotIn(10, self.sl)
+        self.assertIn(11, self.sl)
+    
+    def test_items_in_range(self):
+        """Test range queries"""
+        for key in range(0, 100, 10):
+            self.sl.insert(key, key)
+        self.assertEqual([k for k, _ in self.sl.items_in_range(15, 50)], [20, 30, 40, 50])
+    
+    def test_non_integer_key(self):
+        """Test that non-integer keys are rejected"""
+        with self.assertRaises(TypeError):
+            self.sl.insert("five", 5)
+    
+    def test_key_range(self):
+        """Test that keys outside the int64 range are rejected either way"""
+        self.sl.insert(2 ** 63 - 1, "max")
+        self.sl.insert(-2 ** 63, "min")
+        self.assertEqual(self.sl.get_all_items(), [(-2 ** 63, "min"), (2 ** 63 - 1, "max")])
+        for key in (2 ** 63, -2 ** 63 - 1, 2 ** 70):
+            with self.assertRaises(OverflowError):
+                self.sl.insert(key, "big")
+            with self.assertRaises(OverflowError):
+                self.sl.search(key)
+        self.assertEqual(len(self.sl), 2)
+    
+    def test_bulk_loading_key_checks(self):
+        """Test that from_sorted checks keys like insert does"""
+        for cls in (CSkipList, SkipListInt64):
+            with self.assertRaises(TypeError):
+                cls.from_sorted([(1, "a"), (2, "b"), (2.5, "c")])
+            with self.assertRaises(OverflowError):
+                cls.from_sorted([(1, "a"), (2 ** 70, "big")])
+            with self.assertRaises(OverflowError):
+                cls.from_sorted([(-2 ** 63 - 1, "small")])
+            self.assertEqual(cls.from_sorted([(True, "t")]).get_all_items(), [(1, "t")])
+    
+    def test_invalid_arguments(self):
+        """Test that a negative max_level or a bad p is rejected either way"""
+        with self.assertRaises(ValueError):
+            CSkipList(max_level=-1)
+        for p in (0, 1):
+            with self.assertRaises(ValueError):
+                CSkipList(p=p)
+        if cskip_list._lib is not None:
+            # The library checks too, rather than writing past its buffers
+            with self.assertRaises(ValueError):
+                cskip_list._lib.sl_new(-1, 0.5, 1)
+    
+    def test_bulk_loading(self):
+        """Test from_sorted and insert_many"""
+        sl = CSkipList.from_sorted([(3, "c"), (1, "a"), (2, "b"), (1, "A")], max_level=8, p=0.5)
+        self.assertEqual(sl.get_all_items(), [(1, "A"), (2, "b"), (3, "c")])
+        
+        sl.insert_many([(5, "e"), (0, "z"), (2, "B")])
+        self.assertEqual(list(sl), [(0, "z"), (1, "A"), (2, "B"), (3, "c"), (5, "e")])
+        self.assertEqual(len(sl), 5)
+    
+    def test_display(self):
+        """Test that display logs every level down to the base list"""
+        for key in range(1, 4):
+            self.sl.insert(key, str(key))
+        with self.assertLogs(level="INFO") as logs:
+            self.sl.display()
+        output = logs.records[0].getMessage()
+        self.assertIn("Level 0: [1:1] -> [2:2] -> [3:3] -> None", output)
+        self.assertIn(f"Level {self.sl.level}: ", output)
+
+
+class TestVisualization(unittest.TestCase):
+    """Test cases for the visualization module"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        # from_sorted gives node i a height of trailing zeros of i
+        self.sl = SkipList.from_sorted([(k, str(k)) for k in range(1, 5)])
+    
+    def test_empty_skip_list(self):
+        """Test that both views report an empty list"""
+        for visualize in (visualize_skip_list_detailed, visualize_skip_list_compact):
+            out = io.StringIO()
+            visualize(SkipList(), out)
+            self.assertEqual(out.getvalue(), "\n[Empty Skip List]\n\n")
+    
+    def test_detailed(self):
+        """Test the per-level view"""
+        out = io.StringIO()
+        visualize_skip_list_detailed(self.sl, out)
+        lines = out.getvalue().splitlines()
+        self.assertIn("HEAD --> [4] --> None", lines)
+        self.assertIn("HEAD --> [2] -------- --> [4] --> None", lines)
+        self.assertIn("HEAD --> [1]  --> [2]  --> [3]  --> [4] --> None", lines)
+        self.assertIn("Total nodes: 4", lines)
+        self.assertIn("Maximum level: 2", lines)
+    
+    def test_compact(self):
+        """Test the tower view"""
+        out = io.StringIO()
+        visualize_skip_list_compact(self.sl, out)
+        lines = out.getvalue().splitlines()
+        self.assertIn("L2:                   [  4] ", lines)
+        self.assertIn("L1:       [  2]       [  4] ", lines)
+        self.assertIn("L0: [  1] [  2] [  3] [  4] ", lines)
+        self.assertIn("  Key:   4 | Value: 4               | Max Level: 2", lines)
+    
+    def test_w3(self):
+        """Test the cached key formatting agrees with the format spec"""
+        for key in (0, 7, 42, 999, 1023, 1024, 123456, -3, True, 2.5, "ab"):
+            self.assertEqual(visualization._w3(key), f"{key:3}")
+    
+    @unittest.skipIf(visualization.build_tower is None, "compiled _tower not built")
+    def test_compiled_tower_rows(self):
+        """Test the compiled tower layout matches the Python one"""
+        max_lvl = [0, 2, 1, 0, 3]
+        for keys in ([1, 22, 333, 4444, -5], [-2 ** 63, 0, 7, 2 ** 63 - 1, 9]):
+            self.assertEqual("".join(visualization._tower_rows_compiled(keys, max_lvl, 3)),
+                             "".join(visualization._tower_rows(keys, max_lvl, 3)))
+        # Keys the compiled layout cannot take go through Python
+        keys = ["a", "b", "c", "d", 2 ** 64]
+        self.assertEqual(visualization._tower_rows_compiled(keys, max_lvl, 3),
+                         visualization._tower_rows(keys, max_lvl, 3))
+
+
 class TestSkipListPerformance(unittest.TestCase):
     """Performance-related tests for Skip List"""
     
@@ -216,6 +632,31 @@ class TestSkipListPerformance(unittest.TestCase):
         # Higher levels should be progressively rarer
         max_level = max(levels)
         self.assertLessEqual(max_level, 10)
+    
+    def test_default_probability(self):
+        """Test the default promotion probability and its level distribution"""
+        sl = SkipList(max_level=10)
+        self.assertAlmostEqual(sl.p, 1 / math.e)
+        
+        levels = [sl.random_level() for _ in range(1000)]
+        level_0_count = levels.count(0)
+        self.assertGreater(level_0_count, 570)  # Should be around 63%
+        self.assertLess(level_0_count, 700)
+        self.assertLessEqual(max(levels), 10)
+    
+    def test_invalid_probability(self):
+        """Test that p outside (0, 1) is rejected"""
+        for p in (0, 1, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                SkipList(p=p)
+    
+    def test_invalid_max_level(self):
+        """Test that a negative max_level is rejected"""
+        with self.assertRaises(ValueError):
+            SkipList(max_level=-1)
+        with self.assertRaises(ValueError):
+            BSkipList(max_level=-1)
+        self.assertEqual(len(SkipList(max_level=0)), 0)
 
 
 def run_performance_test():
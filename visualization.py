@@ -3,143 +3,209 @@ Visualization module for Skip List
 Provides visual representation of the skip list structure
 """
 
-from skip_list import SkipList
+import logging
+import sys
+from array import array
+from typing import TYPE_CHECKING, Optional, TextIO
 
+try:
+    from _tower import build_tower
+except ImportError:
+    # Compiled tower layout, built by setup.py when Cython is installed
+    build_tower = None
 
-def visualize_skip_list_detailed(sl: SkipList) -> None:
+if TYPE_CHECKING:
+    # Only needed for annotations; demo_visualizations imports it when run
+    from skip_list import SkipList
+
+
+# Link drawn between consecutive nodes on a level, and the end of a level
+SEP = " --> "
+ARROW_END = " --> None"
+
+# Dash runs already built, by length. Gaps are 8 dashes per skipped node, so
+# the short runs between nearby nodes repeat a lot; on the upper levels gaps
+# grow with the list, so runs longer than _DASH_CACHE_MAX are built each time
+# rather than kept alive
+_DASH_CACHE = {}
+_DASH_CACHE_MAX = 8 * 16
+
+
+def _dashes(k: int) -> str:
+    """
+    Return a run of k dashes, reusing a previously built string when k is
+    small.
+    """
+    if k > _DASH_CACHE_MAX:
+        return "-" * k
+    s = _DASH_CACHE.get(k)
+    if s is None:
+        s = _DASH_CACHE[k] = "-" * k
+    return s
+
+
+# f"{k:3}" for 0 <= k < len(_STR3_CACHE); grown on demand up to _STR3_CAP
+_STR3_CACHE = []
+_STR3_CAP = 1024
+
+
+def _w3(k) -> str:
+    """
+    Return f"{k:3}", looked up in a table when k is a small non-negative int.
+    """
+    if type(k) is int and 0 <= k < _STR3_CAP:
+        if k >= len(_STR3_CACHE):
+            _STR3_CACHE.extend(f"{i:3}" for i in range(len(_STR3_CACHE), k + 1))
+        return _STR3_CACHE[k]
+    return f"{k:3}"
+
+
+def visualize_skip_list_detailed(sl: "SkipList", out: Optional[TextIO] = None) -> None:
     """
     Create a detailed ASCII visualization of the skip list structure.
     Shows the connections between nodes at different levels.
     
     Args:
         sl: SkipList instance to visualize
+        out: Text stream to write to (defaults to sys.stdout)
     """
-    if sl.level == -1 or sl.header.forward[0] is None:
-        print("\n[Empty Skip List]\n")
-        return
-    
-    # Collect all nodes at level 0
-    nodes = []
-    current = sl.header.forward[0]
-    while current:
-        nodes.append(current)
-        current = current.forward[0]
-    
-    if not nodes:
-        print("\n[Empty Skip List]\n")
+    if out is None:
+        out = sys.stdout
+    header_fwd = sl.header.forward
+
+    if sl.level == -1 or header_fwd[0] is None:
+        out.write("\n[Empty Skip List]\n\n")
         return
     
-    print("\n" + "="*80)
-    print("DETAILED SKIP LIST VISUALIZATION")
-    print("="*80)
+    # Position of each level-0 node in the base list. Higher levels link the
+    # very same node objects, so they are matched by identity and keys are
+    # never compared
+    positions = {id(node): i for i, node in enumerate(sl.nodes())}
+
+    out.write("\n" + "="*80 + "\n"
+              "DETAILED SKIP LIST VISUALIZATION\n"
+              + "="*80 + "\n")
     
-    # Print each level
+    # Each level is written as soon as it has been walked
     for level in range(sl.level, -1, -1):
-        print(f"\nLevel {level}:")
-        print("-" * 80)
-        
-        # Build the visualization for this level
-        current = sl.header.forward[level]
-        node_positions = []
-        
-        # Find which nodes exist at this level
+        parts = [f"\nLevel {level}:\n", "-" * 80 + "\n", "HEAD"]
+        prev_pos = -1
+        current = header_fwd[level]
         while current:
-            # Find position of this node in the base list
-            for i, node in enumerate(nodes):
-                if node.key == current.key:
-                    node_positions.append((i, current))
-                    break
+            pos = positions[id(current)]
+            # Leave room for the nodes this level skips over
+            if prev_pos >= 0:
+                parts.append(" ")
+                parts.append(_dashes((pos - prev_pos - 1) * 8))
+            parts.append(SEP)
+            parts.append(f"[{current.key}]")
+            prev_pos = pos
             current = current.forward[level]
-        
-        # Create the visual representation
-        line = "HEAD"
-        for i, (pos, node) in enumerate(node_positions):
-            # Add spacing
-            if i == 0:
-                line += " --> "
-            else:
-                prev_pos = node_positions[i-1][0]
-                spacing = (pos - prev_pos - 1) * 8
-                line += " " + "-" * spacing + " --> "
-            
-            line += f"[{node.key}]"
-        
-        line += " --> None"
-        print(line)
+        parts.append(ARROW_END + "\n")
+        out.write("".join(parts))
     
-    print("\n" + "="*80)
-    print(f"Total nodes: {len(nodes)}")
-    print(f"Maximum level: {sl.level}")
-    print("="*80 + "\n")
+    out.write("\n" + "="*80 + "\n"
+              f"Total nodes: {len(positions)}\n"
+              f"Maximum level: {sl.level}\n"
+              + "="*80 + "\n\n")
 
 
-def visualize_skip_list_compact(sl: SkipList) -> None:
+def visualize_skip_list_compact(sl: "SkipList", out: Optional[TextIO] = None) -> None:
     """
     Create a compact visualization showing node heights.
     
     Args:
         sl: SkipList instance to visualize
+        out: Text stream to write to (defaults to sys.stdout)
     """
+    if out is None:
+        out = sys.stdout
+
     if sl.header.forward[0] is None:
-        print("\n[Empty Skip List]\n")
+        out.write("\n[Empty Skip List]\n\n")
         return
     
-    # Collect all nodes with their max levels
-    node_info = []
-    current = sl.header.forward[0]
-    
-    while current:
-        # Find max level for this node
-        max_level = 0
-        for level in range(sl.level + 1):
-            temp = sl.header.forward[level]
-            while temp:
-                if temp.key == current.key:
-                    max_level = level
-                    break
-                temp = temp.forward[level]
-        
-        node_info.append((current.key, current.value, max_level))
-        current = current.forward[0]
-    
-    print("\n" + "="*80)
-    print("SKIP LIST TOWER VISUALIZATION")
-    print("="*80)
-    print("\nEach node is shown as a tower with height = max level")
-    print()
-    
-    # Find the maximum level for visualization
-    max_display_level = max(info[2] for info in node_info)
-    
+    # Collect all nodes at level 0. Each node's forward list holds exactly
+    # one pointer per level it reaches, so its max level is read off directly
+    # and no higher level has to be walked
+    nodes = list(sl.nodes())
+    max_lvl = [len(node.forward) - 1 for node in nodes]
+    max_display_level = max(max_lvl)
+
+    node_info = [(node.key, node.value, max_level)
+                 for node, max_level in zip(nodes, max_lvl)]
+
+    # Everything is collected here and written in one go at the end
+    buf = ["\n", "="*80, "\n",
+           "SKIP LIST TOWER VISUALIZATION\n",
+           "="*80, "\n",
+           "\nEach node is shown as a tower with height = max level\n",
+           "\n"]
+
     # Print from top level down
-    for level in range(max_display_level, -1, -1):
-        print(f"L{level}: ", end="")
-        for key, value, max_level in node_info:
-            if max_level >= level:
-                print(f"[{key:3}]", end=" ")
-            else:
-                print("     ", end=" ")
-        print()
-    
+    tower_rows = _tower_rows if build_tower is None else _tower_rows_compiled
+    buf.extend(tower_rows([node.key for node in nodes], max_lvl, max_display_level))
+
     # Print keys at bottom
-    print("     ", end="")
-    for key, value, _ in node_info:
-        print(f" {key:3} ", end=" ")
-    print("\n")
+    buf.append("     ")
+    buf.extend(f" {_w3(key)}  " for key, _, _ in node_info)
+    buf.append("\n\n")
     
     # Print statistics
-    print("Node Details:")
+    buf.append("Node Details:\n")
     for key, value, max_level in node_info:
-        print(f"  Key: {key:3} | Value: {value:15} | Max Level: {max_level}")
+        buf.append(f"  Key: {_w3(key)} | Value: {value:15} | Max Level: {max_level}\n")
     
-    print("\n" + "="*80 + "\n")
+    buf.append("\n" + "="*80 + "\n\n")
+    out.write("".join(buf))
 
 
-def demo_visualizations():
+def _tower_rows(keys: list, max_lvl: list, max_display_level: int) -> list:
+    """
+    Build the tower rows from the top level down.
+    
+    Args:
+        keys: Key of each node
+        max_lvl: Max level of each node
+        max_display_level: Highest level to draw
+    
+    Returns:
+        One line per level, each cell followed by a space
+    """
+    # Format each key's cell once rather than once per level
+    cells = [f"[{_w3(key)}]" for key in keys]
+    blank = "     "
+    rows = []
+    for level in range(max_display_level, -1, -1):
+        row = [cell if max_level >= level else blank
+               for cell, max_level in zip(cells, max_lvl)]
+        rows.append(f"L{level}: " + " ".join(row) + " \n")
+    return rows
+
+
+def _tower_rows_compiled(keys: list, max_lvl: list, max_display_level: int) -> list:
+    """
+    _tower_rows() through the compiled build_tower(), which only takes keys
+    that fit in a signed 64-bit integer; other keys use the Python layout.
+    """
+    try:
+        keys_arr = array("q", keys)
+    except (TypeError, OverflowError):
+        return _tower_rows(keys, max_lvl, max_display_level)
+    rows = build_tower(keys_arr, array("i", max_lvl), max_display_level)
+    return [rows.decode("ascii")]
+
+
+def demo_visualizations(verbose: bool = True, data: Optional[list] = None):
     """
     Demonstrate different visualization styles.
+    
+    Args:
+        verbose: Print a line for every inserted pair
+        data: (key, value) pairs to load; defaults to a small fixed set
     """
     import random
+    from skip_list import SkipList
     random.seed(42)
     
     print("\n" + "="*80)
@@ -149,14 +215,19 @@ def demo_visualizations():
     sl = SkipList(max_level=4, p=0.5)
     
     # Insert some data
-    data = [(3, "three"), (6, "six"), (7, "seven"), (9, "nine"), 
-            (12, "twelve"), (17, "seventeen"), (19, "nineteen"), 
-            (21, "twenty-one"), (25, "twenty-five")]
+    if data is None:
+        data = [(3, "three"), (6, "six"), (7, "seven"), (9, "nine"), 
+                (12, "twelve"), (17, "seventeen"), (19, "nineteen"), 
+                (21, "twenty-one"), (25, "twenty-five")]
     
     print("Inserting data into skip list...")
-    for key, value in data:
-        sl.insert(key, value)
-        print(f"  Inserted: {key} -> {value}")
+    if verbose:
+        for key, value in data:
+            sl.insert(key, value)
+            print(f"  Inserted: {key} -> {value}")
+    else:
+        sl.insert_many(data)
+        print(f"  Inserted {len(sl)} keys")
     
     # Show standard display
     print("\n" + "="*80)
@@ -191,5 +262,7 @@ def demo_visualizations():
 
 
 if __name__ == "__main__":
+    # SkipList.display() writes through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     demo_visualizations()
 